@@ -43,10 +43,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[entry.entry_id] = coordinator
+    domain_data.setdefault("_coordinators", {})[entry.entry_id] = coordinator
 
-    # Ensure services are set up (will be no-op if already registered)
-    await async_setup_services(hass)
+    # Services are registered once in async_setup
 
     # Ensure panel is registered (will be no-op if already registered)
     await async_register_panel(hass)
@@ -59,11 +60,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-        # Since only one config entry is allowed, always unload services when unloading
-        # Panel is NOT unregistered here - only in async_remove_entry
-        await async_unload_services(hass)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].get("_coordinators", {}).pop(entry.entry_id, None)
+
+        # Drop the unloaded coordinator's medications from the service
+        # dispatch index
+        med_index = hass.data[DOMAIN].get("_med_index", {})
+        for medication_id in [
+            med_id for med_id, coord in med_index.items() if coord is coordinator
+        ]:
+            del med_index[medication_id]
+
+        # Services and panel stay registered across unload/reload; both are
+        # cleaned up in async_remove_entry
 
     return unload_ok
 
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from bisect import insort
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from heapq import merge
 import logging
+from operator import attrgetter
+from typing import Final
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
@@ -15,6 +20,25 @@ from .coordinator import MedicationCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Calendar frontends re-request overlapping windows while the user pans, so
+# keep a handful of recently built event lists around
+_EVENT_CACHE_SIZE = 8
+
+# Dose events are rendered as short 5-minute blocks
+_DOSE_EVENT_DURATION = timedelta(minutes=5)
+
+# Refill reminders appear as one-hour events starting at 9 AM
+_REFILL_TIME = time(9, 0)
+_REFILL_EVENT_DURATION = timedelta(hours=1)
+
+# Shared across instances so device-registry comparisons hit the same object
+_DEVICE_INFO: Final = {
+    "identifiers": {(DOMAIN, "dose_calendar")},
+    "name": "Medication Tracker Calendar",
+    "manufacturer": "Home Assistant",
+    "model": "Dose History Calendar",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,12 +61,14 @@ class MedicationTrackerCalendar(CalendarEntity):
         self._coordinator = coordinator
         self._attr_name = "Medication Tracker Dose Taken"
         self._attr_unique_id = f"{DOMAIN}_dose_taken"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, "dose_calendar")},
-            "name": "Medication Tracker Calendar",
-            "manufacturer": "Home Assistant",
-            "model": "Dose History Calendar",
-        }
+        self._attr_device_info = _DEVICE_INFO
+        # Built event lists keyed by (start, end, last_updated); entries are
+        # only valid for the coordinator tick they were built in
+        self._event_cache: OrderedDict[
+            tuple[datetime, datetime, datetime | None], list[CalendarEvent]
+        ] = OrderedDict()
+        # Static per-medication format strings, invalidated on coordinator update
+        self._summary_cache: dict[tuple[str, bool], str] = {}
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -58,58 +84,91 @@ class MedicationTrackerCalendar(CalendarEntity):
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
+        last_updated = self._coordinator.data.get("last_updated")
+        cache_key = (start_date, end_date, last_updated)
+        if (cached := self._event_cache.get(cache_key)) is not None:
+            self._event_cache.move_to_end(cache_key)
+            return cached
+
         events = []
 
         medications = self._coordinator.data.get("medications", {})
 
-        for medication_id, medication in medications.items():
-            # Get dose history for this medication
-            for dose_record in medication.dose_history:
-                dose_time = dose_record.timestamp
-
-                # Compare using dates to avoid timezone issues
-                if start_date.date() <= dose_time.date() <= end_date.date():
-                    event_summary = self._create_event_summary(medication, dose_record)
-                    event_description = self._create_event_description(
-                        medication, dose_record
-                    )
+        # Widen the window to whole days and compare datetimes directly so the
+        # merged timestamp index can be binary searched
+        start_day = start_date.date()
+        end_day = end_date.date()
+        window_start = datetime.combine(start_day, time.min, tzinfo=start_date.tzinfo)
+        window_end = datetime.combine(
+            end_day, time.min, tzinfo=end_date.tzinfo
+        ) + timedelta(days=1)
+
+        events_append = events.append
+        # Doses past the hot in-memory window live in the cold archive;
+        # the coordinator only reads it when the window reaches that far
+        # back. One binary search over the coordinator's merged dose index
+        # covers every medication at once.
+        archived = await self._coordinator.async_get_archived_doses(
+            window_start, window_end
+        )
+        doses = self._coordinator.get_doses_between(window_start, window_end)
+        if archived:
+            # Both sources are sorted, but a backdated hot dose can predate
+            # archived records, so merge rather than concatenate
+            doses = list(merge(archived, doses, key=lambda pair: pair[1].timestamp))
+        for medication, dose_record in doses:
+            dose_time = dose_record.timestamp
+            event_summary = self._create_event_summary(medication, dose_record)
+            event_description = self._create_event_description(
+                medication, dose_record
+            )
 
-                    event = CalendarEvent(
-                        start=dose_time,
-                        end=dose_time + timedelta(minutes=5),
-                        summary=event_summary,
-                        description=event_description,
-                        uid=f"{DOMAIN}_{medication_id}_{dose_time.isoformat()}",
-                    )
-                    events.append(event)
+            events_append(
+                CalendarEvent(
+                    start=dose_time,
+                    end=dose_time + _DOSE_EVENT_DURATION,
+                    summary=event_summary,
+                    description=event_description,
+                    uid=dose_record.uid,
+                )
+            )
 
+        for medication_id, medication in medications.items():
             # Add estimated refill date event if enabled
             if (
                 medication.data.supply_tracking_enabled
                 and medication.data.show_refill_on_calendar
             ):
                 refill_date = medication.estimated_refill_date
-                if refill_date and start_date.date() <= refill_date <= end_date.date():
+                if refill_date and start_day <= refill_date <= end_day:
                     refill_datetime = datetime.combine(
-                        refill_date, datetime.min.time().replace(hour=9, minute=0),
-                        tzinfo=start_date.tzinfo
+                        refill_date, _REFILL_TIME, tzinfo=start_date.tzinfo
                     )
                     event = CalendarEvent(
                         start=refill_datetime,
-                        end=refill_datetime + timedelta(hours=1),
+                        end=refill_datetime + _REFILL_EVENT_DURATION,
                         summary=f"💊 Refill Needed: {medication.data.name}",
                         description=self._create_refill_event_description(medication),
                         uid=f"{DOMAIN}_{medication_id}_refill_{refill_date.isoformat()}",
                     )
-                    events.append(event)
-
-        events.sort(key=lambda x: x.start)
+                    # Dose events arrive pre-sorted from the merged index, so
+                    # slot the few refill events in by position instead of
+                    # re-sorting the whole list
+                    insort(events, event, key=attrgetter("start"))
+
+        self._event_cache[cache_key] = events
+        if len(self._event_cache) > _EVENT_CACHE_SIZE:
+            self._event_cache.popitem(last=False)
         return events
 
     def _create_event_summary(self, medication, dose_record) -> str:
         """Create a summary for the calendar event."""
-        status = "✅ Taken" if dose_record.taken else "❌ Skipped"
-        return f"{status}: {medication.data.name} ({medication.data.dosage})"
+        key = (medication.id, dose_record.taken)
+        if (summary := self._summary_cache.get(key)) is None:
+            status = "✅ Taken" if dose_record.taken else "❌ Skipped"
+            summary = f"{status}: {medication.data.name} ({medication.data.dosage})"
+            self._summary_cache[key] = summary
+        return summary
 
     def _create_event_description(self, medication, dose_record) -> str:
         """Create a description for the calendar event."""
@@ -118,7 +177,7 @@ class MedicationTrackerCalendar(CalendarEntity):
             f"Medication: {medication.data.name}",
             f"Dosage: {medication.data.dosage}",
             f"Status: {status.title()}",
-            f"Time: {dose_record.timestamp.strftime('%I:%M %p')}",
+            f"Time: {dose_record.time_display}",
         ]
 
         if dose_record.notes:
@@ -168,5 +227,13 @@ class MedicationTrackerCalendar(CalendarEntity):
         await super().async_added_to_hass()
         # Listen for coordinator updates
         self.async_on_remove(
-            self._coordinator.async_add_listener(self.async_write_ha_state)
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
         )
+
+    def _handle_coordinator_update(self) -> None:
+        """Drop cached events when the coordinator data changes."""
+        # Cache keys include last_updated, so stale entries could never be
+        # served; clearing just frees them and the cached format strings
+        self._event_cache.clear()
+        self._summary_cache.clear()
+        self.async_write_ha_state()
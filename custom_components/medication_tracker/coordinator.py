@@ -2,27 +2,62 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from bisect import bisect_left, insort
+from collections.abc import Callable, Mapping
+import contextlib
 from datetime import datetime, timedelta
+from functools import partial
+import json
 import logging
+from operator import itemgetter
+import os
+from types import MappingProxyType
 from typing import Any
 import uuid
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .const import DEVICE_MANUFACTURER, DEVICE_MODEL, DOMAIN, EVENT_MEDICATION_LOW_SUPPLY
-from .models import MedicationData, MedicationEntry
+from .models import DoseRecord, MedicationData, MedicationEntry
 
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}_medications"
+DOSE_STORAGE_KEY = f"{DOMAIN}_doses_{{}}"  # formatted with the medication id
 UPDATE_INTERVAL = timedelta(minutes=1)
+SAVE_DELAY = 10  # seconds to coalesce storage writes
+REFRESH_DEBOUNCE_COOLDOWN = 0.3  # seconds to coalesce listener fan-outs
+# Above this many total doses, status updates move to the executor so the
+# per-minute tick cannot stall the event loop
+STATUS_EXECUTOR_THRESHOLD = 1000
+# Doses older than this move from the in-memory hot history to an
+# append-only archive file, read only when the calendar looks that far back
+HOT_HISTORY_DAYS = 180
+# Don't bother archiving until a history is actually large
+HOT_HISTORY_MIN_RECORDS = 500
+
+_UNIQUE_ID_PREFIX = f"{DOMAIN}_"
+
+
+def _medication_id_from_unique_id(unique_id: str) -> str | None:
+    """Extract the medication id from a platform entity unique_id.
+
+    Platform unique_ids follow f"{DOMAIN}_{medication_id}_{kind}".
+    Medication ids are UUIDs and never contain underscores, so the id is
+    exactly the first underscore-separated segment after the domain
+    prefix — no substring matching needed.
+    """
+    if not unique_id.startswith(_UNIQUE_ID_PREFIX):
+        return None
+    return unique_id[len(_UNIQUE_ID_PREFIX) :].split("_", 1)[0]
 
 
 class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -38,36 +73,193 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             config_entry=config_entry,
         )
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        # Dose histories are stored per medication and hydrated separately
+        # from the metadata, so startup only parses the small meta blob
+        self._dose_stores: dict[str, Store] = {}
+        self._doses_loaded: set[str] = set()
+        self._dirty_dose_ids: set[str] = set()
         self._medications: dict[str, MedicationEntry] = {}
+        # Doses of all medications merged into one chronological index so
+        # calendar range queries need a single binary search regardless of
+        # how many medications exist
+        self._dose_index: list[tuple[datetime, str, DoseRecord]] = []
+        # Newest timestamp across all archive files; None means no archive
+        # exists. Recovered from the files at load, updated on append, and
+        # used to decide whether a calendar window needs a disk read.
+        self._archive_newest: datetime | None = None
         self._entity_creation_callbacks: dict[str, Callable[..., Any]] = {}
         self._config_entry_id: str = config_entry.entry_id
+        # Serializes dose-history mutations against the executor-based
+        # status scan, which reads the histories from another thread
+        self._history_lock = asyncio.Lock()
+        # Mutations schedule refreshes through this debouncer so a burst of
+        # service calls triggers a single listener fan-out
+        self._refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REFRESH_DEBOUNCE_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
 
     def _fire_event(self, event_type: str, event_data: dict[str, Any]) -> None:
-        """Fire a Home Assistant event."""
-        self.hass.bus.async_fire(event_type, event_data)
+        """Fire a Home Assistant event.
+
+        Goes through call_soon_threadsafe so status updates may run in an
+        executor thread while events are still fired on the event loop.
+        """
+        self.hass.loop.call_soon_threadsafe(
+            self.hass.bus.async_fire, event_type, event_data
+        )
 
     async def async_load_medications(self) -> None:
-        """Load medications from storage."""
+        """Load medication metadata from storage.
+
+        Dose histories are hydrated lazily from their per-medication
+        stores on the first update cycle; legacy combined blobs that
+        still carry inline histories are migrated to the split layout.
+        """
         try:
             data = await self._store.async_load()
             if data is not None:
+                legacy_ids: list[str] = []
                 for med_id, med_data in data.get("medications", {}).items():
                     medication = MedicationEntry.from_dict(med_data, self._fire_event)
                     self._medications[med_id] = medication
+                    if med_data.get("dose_history"):
+                        # Legacy format: history came inline, re-home it
+                        # into the medication's own dose store
+                        legacy_ids.append(med_id)
+                        self._doses_loaded.add(med_id)
+                    elif "dose_history" in med_data:
+                        self._doses_loaded.add(med_id)
+                    self._medication_index[med_id] = self
+                self._rebuild_dose_index()
+                if legacy_ids:
+                    # Write the re-homed dose stores before the stripped
+                    # meta blob can flush: if the meta landed first and the
+                    # process died, the histories would exist nowhere
+                    for med_id in legacy_ids:
+                        await self._get_dose_store(med_id).async_save(
+                            self._dose_data_to_save(med_id)
+                        )
+                    await self.async_save_medications()
+                # Recover archive coverage from the files themselves so
+                # the skip-disk gate survives restarts and crashes
+                self._archive_newest = await self.hass.async_add_executor_job(
+                    self._read_archive_newest,
+                    [self._archive_path(med_id) for med_id in self._medications],
+                )
         except (OSError, ValueError) as err:
             _LOGGER.error("Error loading medications: %s", err)
 
-    async def async_save_medications(self) -> None:
-        """Save medications to storage."""
-        try:
-            data = {
-                "medications": {
-                    med_id: med.to_dict() for med_id, med in self._medications.items()
-                }
+    @property
+    def _medication_index(self) -> dict[str, MedicationCoordinator]:
+        """Domain-wide medication id -> coordinator map for service dispatch."""
+        return self.hass.data.setdefault(DOMAIN, {}).setdefault("_med_index", {})
+
+    def _get_dose_store(self, medication_id: str) -> Store:
+        """Get (or create) the dose history store for a medication."""
+        if (store := self._dose_stores.get(medication_id)) is None:
+            store = Store(
+                self.hass, STORAGE_VERSION, DOSE_STORAGE_KEY.format(medication_id)
+            )
+            self._dose_stores[medication_id] = store
+        return store
+
+    async def _async_load_doses(self, medication: MedicationEntry) -> None:
+        """Hydrate a medication's dose history from its own store."""
+        data = await self._get_dose_store(medication.id).async_load()
+        medication.set_dose_history(
+            [
+                DoseRecord.from_dict(record)
+                for record in (data or {}).get("dose_history", [])
+            ]
+        )
+        self._doses_loaded.add(medication.id)
+
+    def _rebuild_dose_index(self) -> None:
+        """Rebuild the merged chronological dose index from all medications."""
+        self._dose_index = sorted(
+            (
+                (record.timestamp, med_id, record)
+                for med_id, medication in self._medications.items()
+                for record in medication.dose_history
+            ),
+            key=itemgetter(0),
+        )
+
+    def _index_dose(self, medication_id: str, record: DoseRecord) -> None:
+        """Insert a newly recorded dose into the merged index."""
+        insort(
+            self._dose_index,
+            (record.timestamp, medication_id, record),
+            key=itemgetter(0),
+        )
+
+    def get_doses_between(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[MedicationEntry, DoseRecord]]:
+        """Return (medication, dose) pairs with start <= timestamp < end.
+
+        One binary search over the merged index, so the cost is
+        O(log total doses + matches) regardless of medication count.
+        """
+        index = self._dose_index
+        if not index or index[-1][0] < start or index[0][0] >= end:
+            return []
+        lo = bisect_left(index, start, key=itemgetter(0))
+        hi = bisect_left(index, end, key=itemgetter(0))
+        medications = self._medications
+        return [
+            (medications[med_id], record) for _, med_id, record in index[lo:hi]
+        ]
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Serialize the medication metadata, called at flush time."""
+        return {
+            "medications": {
+                med_id: med.to_dict(include_history=False)
+                for med_id, med in self._medications.items()
             }
-            await self._store.async_save(data)
-        except (OSError, ValueError) as err:
-            _LOGGER.error("Error saving medications: %s", err)
+        }
+
+    def _dose_data_to_save(self, medication_id: str) -> dict[str, Any]:
+        """Serialize one medication's dose history, called at flush time.
+
+        Timestamps are passed through as datetime objects: the store
+        encodes with orjson, whose C-level RFC 3339 formatting is far
+        cheaper than calling isoformat() per record in Python, and the
+        result parses back through DoseRecord.from_dict unchanged.
+        """
+        medication = self._medications.get(medication_id)
+        if medication is None:
+            return {"dose_history": []}
+        return {
+            "dose_history": [
+                {
+                    "timestamp": record.timestamp,
+                    "taken": record.taken,
+                    "notes": record.notes,
+                }
+                for record in medication.dose_history
+            ]
+        }
+
+    async def async_save_medications(self) -> None:
+        """Schedule a save of medications to storage.
+
+        Writes are coalesced via Store.async_delay_save so a burst of
+        service calls produces one JSON encode and one disk write per
+        touched store. The stores flush any pending data themselves when
+        Home Assistant stops.
+        """
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        for medication_id in self._dirty_dose_ids:
+            self._get_dose_store(medication_id).async_delay_save(
+                partial(self._dose_data_to_save, medication_id), SAVE_DELAY
+            )
+        self._dirty_dose_ids.clear()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update medication data."""
@@ -76,10 +268,33 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not self._medications:
                 await self.async_load_medications()
 
-            # Update medication statuses
+            # Hydrate any dose histories not yet loaded from their stores
+            if len(self._doses_loaded) < len(self._medications):
+                hydrated = False
+                for medication in list(self._medications.values()):
+                    if medication.id not in self._doses_loaded:
+                        await self._async_load_doses(medication)
+                        hydrated = True
+                if hydrated:
+                    self._rebuild_dose_index()
+
+            # Update medication statuses; long dose histories make this
+            # tick expensive enough to move off the event loop
             now = dt_util.now()
-            for medication in self._medications.values():
-                medication.update_status(now)
+            if len(self._dose_index) > STATUS_EXECUTOR_THRESHOLD:
+                # Snapshot the medications so service handlers adding or
+                # removing entries cannot change the dict mid-iteration,
+                # and hold the history lock so no dose is inserted into a
+                # history the executor thread is scanning
+                async with self._history_lock:
+                    await self.hass.async_add_executor_job(
+                        self._update_statuses, now, list(self._medications.values())
+                    )
+            else:
+                self._update_statuses(now, list(self._medications.values()))
+
+            # Keep the in-memory history bounded to the hot window
+            await self._async_archive_old_doses(now)
 
         except (OSError, ValueError) as err:
             _LOGGER.error("Error updating medication data: %s", err)
@@ -90,6 +305,162 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "last_updated": now,
         }
 
+    def _update_statuses(
+        self, now: datetime, medications: list[MedicationEntry]
+    ) -> None:
+        """Recompute status and derived aggregates for every medication."""
+        for medication in medications:
+            medication.update_status(now)
+            medication.refresh_derived(now)
+
+    def _archive_path(self, medication_id: str) -> str:
+        """Return the cold-tier archive path for a medication."""
+        return self.hass.config.path(
+            STORAGE_DIR, f"{DOMAIN}_doses_archive_{medication_id}.ndjson"
+        )
+
+    async def _async_archive_old_doses(self, now: datetime) -> None:
+        """Move doses past the hot window into per-medication archives."""
+        cutoff = now - timedelta(days=HOT_HISTORY_DAYS)
+        archived_any = False
+        # Snapshot: service handlers can add or remove medications while
+        # this loop is suspended in its awaits
+        for medication in list(self._medications.values()):
+            history = medication.dose_history
+            if (
+                medication.id not in self._doses_loaded
+                or len(history) <= HOT_HISTORY_MIN_RECORDS
+                or history[0].timestamp >= cutoff
+            ):
+                continue
+            # Hold the history lock across the append and drop so a
+            # backdated dose recorded mid-archive cannot slip into the
+            # dropped range without having been written out
+            async with self._history_lock:
+                cold = medication.doses_before(cutoff)
+                if not cold:
+                    continue
+                # Append to the archive before dropping anything from
+                # memory so a failed write (e.g. disk full) loses nothing
+                # and the records are retried on a later tick
+                await self.hass.async_add_executor_job(
+                    self._append_to_archive, self._archive_path(medication.id), cold
+                )
+                medication.drop_doses_before(cutoff)
+                # Flush the truncated store right away rather than via the
+                # delayed save: a crash inside that window would otherwise
+                # re-archive the same records on the next restart
+                await self._get_dose_store(medication.id).async_save(
+                    self._dose_data_to_save(medication.id)
+                )
+            newest = cold[-1].timestamp
+            if self._archive_newest is None or newest > self._archive_newest:
+                self._archive_newest = newest
+            archived_any = True
+        if archived_any:
+            self._rebuild_dose_index()
+
+    @staticmethod
+    def _read_archive_newest(paths: list[str]) -> datetime | None:
+        """Return the newest dose timestamp across the archive files.
+
+        Archives are append-only with ascending timestamps, so only the
+        tail of each file needs reading. A truncated final line from an
+        interrupted write is skipped in favour of the one before it.
+        """
+        newest: datetime | None = None
+        for path in paths:
+            try:
+                with open(path, "rb") as archive:
+                    archive.seek(0, os.SEEK_END)
+                    tail_start = max(0, archive.tell() - 65536)
+                    archive.seek(tail_start)
+                    lines = archive.read().splitlines()
+            except FileNotFoundError:
+                continue
+            except OSError as err:
+                _LOGGER.error("Error reading dose archive %s: %s", path, err)
+                continue
+            for line in reversed(lines):
+                try:
+                    record = DoseRecord.from_dict(json.loads(line))
+                except (ValueError, KeyError):
+                    continue
+                if newest is None or record.timestamp > newest:
+                    newest = record.timestamp
+                break
+        return newest
+
+    @staticmethod
+    def _remove_archive(path: str) -> None:
+        """Delete a medication's archive file if it exists."""
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+    @staticmethod
+    def _append_to_archive(path: str, records: list[DoseRecord]) -> None:
+        """Append dose records to an ndjson archive file."""
+        with open(path, "a", encoding="utf-8") as archive:
+            for record in records:
+                payload = record.to_dict()
+                # Archived records are immutable, so keep the derived
+                # calendar strings instead of recomputing them on read
+                payload["uid"] = record.uid
+                payload["time_display"] = record.time_display
+                archive.write(json.dumps(payload) + "\n")
+
+    async def async_get_archived_doses(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[MedicationEntry, DoseRecord]]:
+        """Return archived (medication, dose) pairs inside the window.
+
+        Only touches disk when the window actually overlaps what the
+        archives hold. Archiving is per medication, so the hot index
+        can still contain timestamps older than another medication's
+        archived doses — the gate therefore tracks archive coverage
+        itself rather than the oldest hot record.
+        """
+        if self._archive_newest is None or start > self._archive_newest:
+            return []
+        return await self.hass.async_add_executor_job(
+            self._read_archived_doses, start, end
+        )
+
+    def _read_archived_doses(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[MedicationEntry, DoseRecord]]:
+        """Scan the archive files for doses inside the window.
+
+        Runs in the executor, so iterate a snapshot of the medications —
+        the event loop is free to add or remove entries meanwhile.
+        """
+        results: list[tuple[datetime, MedicationEntry, DoseRecord]] = []
+        for med_id, medication in list(self._medications.items()):
+            # A retried append after a partial write can leave duplicate
+            # lines in the archive, so dedup by uid while scanning
+            seen_uids: set[str] = set()
+            try:
+                with open(self._archive_path(med_id), encoding="utf-8") as archive:
+                    for line in archive:
+                        payload = json.loads(line)
+                        record = DoseRecord.from_dict(payload)
+                        if not start <= record.timestamp < end:
+                            continue
+                        uid = payload.get("uid", "")
+                        if uid:
+                            if uid in seen_uids:
+                                continue
+                            seen_uids.add(uid)
+                        record.uid = uid
+                        record.time_display = payload.get("time_display", "")
+                        results.append((record.timestamp, medication, record))
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as err:
+                _LOGGER.error("Error reading dose archive for %s: %s", med_id, err)
+        results.sort(key=itemgetter(0))
+        return [(medication, record) for _, medication, record in results]
+
     async def async_add_medication(self, medication_data: MedicationData) -> str:
         """Add a new medication."""
         # Auto-populate start_date with today if not specified
@@ -104,6 +475,9 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             event_callback=self._fire_event,
         )
         self._medications[medication.id] = medication
+        self._medication_index[medication.id] = self
+        # A brand-new medication has no stored doses to hydrate
+        self._doses_loaded.add(medication.id)
         await self.async_save_medications()
 
         # Create device for the medication
@@ -112,7 +486,7 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Notify platforms to create entities for the new medication
         await self._async_create_entities_for_medication(medication.id, medication)
 
-        await self.async_request_refresh()
+        self._refresh_debouncer.async_schedule_call()
         return medication.id
 
     async def async_remove_medication(self, medication_id: str) -> bool:
@@ -125,8 +499,19 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await self._async_remove_device_for_medication(medication_id)
 
             del self._medications[medication_id]
-            await self.async_save_medications()
-            await self.async_request_refresh()
+            self._medication_index.pop(medication_id, None)
+            self._rebuild_dose_index()
+
+            # Drop the medication's dose store and archive with its entry
+            await self._get_dose_store(medication_id).async_remove()
+            self._dose_stores.pop(medication_id, None)
+            self._doses_loaded.discard(medication_id)
+            self._dirty_dose_ids.discard(medication_id)
+            await self.hass.async_add_executor_job(
+                self._remove_archive, self._archive_path(medication_id)
+            )
+
+            await self._async_commit()
             return True
         return False
 
@@ -140,6 +525,7 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Update the medication data
         medication = self._medications[medication_id]
         medication.data = medication_data
+        medication.invalidate_derived()
 
         # Force recalculation of next due time since schedule may have changed
         medication.reset_schedule()
@@ -147,8 +533,7 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         medication.update_status(now)
 
         # Save the changes
-        await self.async_save_medications()
-        await self.async_request_refresh()
+        await self._async_commit()
 
         _LOGGER.info("Updated medication %s (%s)", medication_id, medication_data.name)
         return True
@@ -188,63 +573,73 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Get the entity registry to remove entities
         entity_registry = er.async_get(self.hass)
 
-        # Find and remove all entities for this medication
+        # Only look at entities owned by this config entry instead of
+        # scanning every entity registered in the Home Assistant instance
         entries_to_remove = [
             entry.entity_id
-            for entry in entity_registry.entities.values()
-            if (
-                entry.domain in {"sensor", "binary_sensor", "button"}
-                and entry.platform == DOMAIN
-                and medication_id in entry.unique_id
+            for entry in er.async_entries_for_config_entry(
+                entity_registry, self._config_entry_id
             )
+            if _medication_id_from_unique_id(entry.unique_id) == medication_id
         ]
 
         for entity_id in entries_to_remove:
             entity_registry.async_remove(entity_id)
 
-    async def async_take_medication(
-        self, medication_id: str, taken_at: datetime | None = None
-    ) -> bool:
-        """Mark a medication as taken."""
-        if medication_id not in self._medications:
-            return False
+    async def _async_commit(self) -> None:
+        """Persist pending changes and schedule a coordinator refresh.
 
-        medication = self._medications[medication_id]
-        if taken_at is None:
-            taken_at = dt_util.now()
-
-        # Check if supply was low BEFORE taking (for event firing)
-        was_low_supply = medication.is_low_supply
-
-        medication.record_dose_taken(taken_at)
-
-        # Auto-decrement supply if supply tracking is enabled
-        if medication.data.supply_tracking_enabled:
-            medication.decrement_supply()
+        Shared tail for every mutation method so the debounced save and
+        refresh behave identically across service paths.
+        """
+        await self.async_save_medications()
+        self._refresh_debouncer.async_schedule_call()
 
-            # Fire low supply event if supply just became low
-            if not was_low_supply and medication.is_low_supply:
-                self._fire_low_supply_event(medication)
+    async def _async_record_dose(
+        self, medication_id: str, taken: bool, when: datetime | None
+    ) -> bool:
+        """Record a taken or skipped dose: validate, mutate, index, commit."""
+        medication = self._medications.get(medication_id)
+        if medication is None:
+            return False
 
-        await self.async_save_medications()
-        await self.async_refresh()
+        if when is None:
+            when = dt_util.now()
+
+        # Wait out any in-flight executor status scan before touching
+        # the dose history it may be reading
+        async with self._history_lock:
+            if taken:
+                # Check if supply was low BEFORE taking (for event firing)
+                was_low_supply = medication.is_low_supply
+                record = medication.record_dose_taken(when)
+            else:
+                record = medication.record_dose_skipped(when)
+            self._index_dose(medication_id, record)
+            self._dirty_dose_ids.add(medication_id)
+
+            # Auto-decrement supply if supply tracking is enabled
+            if taken and medication.data.supply_tracking_enabled:
+                medication.decrement_supply()
+
+                # Fire low supply event if supply just became low
+                if not was_low_supply and medication.is_low_supply:
+                    self._fire_low_supply_event(medication)
+
+        await self._async_commit()
         return True
 
+    async def async_take_medication(
+        self, medication_id: str, taken_at: datetime | None = None
+    ) -> bool:
+        """Mark a medication as taken."""
+        return await self._async_record_dose(medication_id, True, taken_at)
+
     async def async_skip_medication(
         self, medication_id: str, skipped_at: datetime | None = None
     ) -> bool:
         """Mark a medication as skipped."""
-        if medication_id not in self._medications:
-            return False
-
-        medication = self._medications[medication_id]
-        if skipped_at is None:
-            skipped_at = dt_util.now()
-
-        medication.record_dose_skipped(skipped_at)
-        await self.async_save_medications()
-        await self.async_refresh()
-        return True
+        return await self._async_record_dose(medication_id, False, skipped_at)
 
     async def _async_create_device_for_medication(
         self, medication: MedicationEntry
@@ -277,9 +672,21 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Get a medication by ID."""
         return self._medications.get(medication_id)
 
-    def get_all_medications(self) -> dict[str, MedicationEntry]:
-        """Get all medications."""
-        return self._medications.copy()
+    def _get_supply_tracked(self, medication_id: str) -> MedicationEntry | None:
+        """Get a medication by ID if it has supply tracking enabled."""
+        medication = self._medications.get(medication_id)
+        if medication is None:
+            return None
+        if not medication.data.supply_tracking_enabled:
+            _LOGGER.warning(
+                "Supply tracking not enabled for medication %s", medication_id
+            )
+            return None
+        return medication
+
+    def get_all_medications(self) -> Mapping[str, MedicationEntry]:
+        """Get a read-only view of all medications."""
+        return MappingProxyType(self._medications)
 
     async def async_refill_medication(
         self,
@@ -288,26 +695,19 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         refill_date: datetime | None = None,
     ) -> bool:
         """Refill medication supply."""
-        if medication_id not in self._medications:
-            return False
-
-        medication = self._medications[medication_id]
-
-        if not medication.data.supply_tracking_enabled:
-            _LOGGER.warning(
-                "Supply tracking not enabled for medication %s", medication_id
-            )
+        medication = self._get_supply_tracked(medication_id)
+        if medication is None:
             return False
 
         # Add to current supply
         current = medication.data.current_supply or 0
         medication.data.current_supply = current + refill_amount
+        medication.invalidate_derived()
 
         # Update last refill date
         medication.data.last_refill_date = refill_date or dt_util.now()
 
-        await self.async_save_medications()
-        await self.async_request_refresh()
+        await self._async_commit()
 
         _LOGGER.info(
             "Refilled medication %s with %d units. New supply: %d",
@@ -321,28 +721,21 @@ class MedicationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self, medication_id: str, new_supply: int
     ) -> bool:
         """Manually update medication supply count."""
-        if medication_id not in self._medications:
-            return False
-
-        medication = self._medications[medication_id]
-
-        if not medication.data.supply_tracking_enabled:
-            _LOGGER.warning(
-                "Supply tracking not enabled for medication %s", medication_id
-            )
+        medication = self._get_supply_tracked(medication_id)
+        if medication is None:
             return False
 
         # Check if supply was low BEFORE updating (for event firing)
         was_low_supply = medication.is_low_supply
 
         medication.data.current_supply = new_supply
+        medication.invalidate_derived()
 
         # Fire low supply event if supply just became low
         if not was_low_supply and medication.is_low_supply:
             self._fire_low_supply_event(medication)
 
-        await self.async_save_medications()
-        await self.async_request_refresh()
+        await self._async_commit()
 
         _LOGGER.info(
             "Updated supply for medication %s to %d", medication_id, new_supply
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
@@ -10,6 +11,7 @@ from typing import Any
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    DOMAIN,
     EVENT_MEDICATION_STATE_CHANGED,
     FREQUENCY_AS_NEEDED,
     FREQUENCY_DAILY,
@@ -113,13 +115,22 @@ class MedicationData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DoseRecord:
-    """Record of a medication dose."""
+    """Record of a medication dose.
+
+    Slotted to keep per-record overhead low: long-lived installs hold
+    thousands of these in memory and iterate them on calendar renders.
+    """
 
     timestamp: datetime
     taken: bool
     notes: str = ""
+    # Derived strings primed when the record joins a medication's history;
+    # they never change for a given dose, so the calendar reuses them
+    # instead of re-running isoformat()/strftime() on every render
+    uid: str = ""
+    time_display: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -155,6 +166,9 @@ class MedicationEntry:
         self.id = id
         self.data = data
         self.dose_history: list[DoseRecord] = []
+        # Timestamps kept sorted in parallel with dose_history so calendar
+        # range queries can use binary search instead of a full scan
+        self._dose_timestamps: list[datetime] = []
         self._current_status = STATE_NOT_DUE
         self._next_due: datetime | None = None
         self._last_taken: datetime | None = None
@@ -162,16 +176,30 @@ class MedicationEntry:
         self.device_id = f"medication_{id}"
         # Callback to fire events when state changes
         self._event_callback = event_callback
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
+        # Cached supply aggregates, refreshed once per coordinator update
+        # cycle instead of recomputed on every property read
+        self._derived_fresh = False
+        self._daily_consumption = 0.0
+        self._days_remaining: float | None = None
+        self._estimated_refill_date: date | None = None
+
+    def to_dict(self, include_history: bool = True) -> dict[str, Any]:
+        """Convert to dictionary.
+
+        With include_history=False only the metadata is serialized; the
+        dose history lives in its own per-medication store.
+        """
+        result = {
             "id": self.id,
             "device_id": self.device_id,
             "data": self.data.to_dict(),
-            "dose_history": [record.to_dict() for record in self.dose_history],
             # Don't cache calculated values - always compute fresh from data
         }
+        if include_history:
+            result["dose_history"] = [
+                record.to_dict() for record in self.dose_history
+            ]
+        return result
 
     @classmethod
     def from_dict(
@@ -186,9 +214,9 @@ class MedicationEntry:
         # Handle legacy data that might not have device_id
         if "device_id" in data:
             entry.device_id = data["device_id"]
-        entry.dose_history = [
-            DoseRecord.from_dict(record) for record in data.get("dose_history", [])
-        ]
+        entry.set_dose_history(
+            [DoseRecord.from_dict(record) for record in data.get("dose_history", [])]
+        )
 
         # Don't load cached calculated values - always compute fresh
         # These will be calculated when update_status() is called
@@ -198,24 +226,78 @@ class MedicationEntry:
 
         return entry
 
-    def record_dose_taken(self, timestamp: datetime, notes: str = "") -> None:
+    def set_dose_history(self, records: list[DoseRecord]) -> None:
+        """Replace the dose history, keeping the timestamp index in sync."""
+        records.sort(key=lambda record: record.timestamp)
+        for record in records:
+            self._prime_dose_strings(record)
+        self.dose_history = records
+        self._dose_timestamps = [record.timestamp for record in records]
+        self.invalidate_derived()
+
+    def _prime_dose_strings(self, record: DoseRecord) -> None:
+        """Precompute the calendar uid and display time for a dose record."""
+        timestamp = record.timestamp
+        record.uid = f"{DOMAIN}_{self.id}_{timestamp.isoformat()}"
+        record.time_display = timestamp.strftime("%I:%M %p")
+
+    def _append_dose(self, record: DoseRecord) -> None:
+        """Insert a dose record while keeping history sorted by timestamp."""
+        # Doses are normally recorded in order, so this is a plain append;
+        # bisect handles backdated doses entered via the service call
+        self._prime_dose_strings(record)
+        index = bisect_right(self._dose_timestamps, record.timestamp)
+        self._dose_timestamps.insert(index, record.timestamp)
+        self.dose_history.insert(index, record)
+        self.invalidate_derived()
+
+    def get_doses_between(
+        self, start: datetime, end: datetime
+    ) -> list[DoseRecord]:
+        """Return dose records with start <= timestamp < end via binary search."""
+        timestamps = self._dose_timestamps
+        # Most medications have no doses in a given calendar window; the
+        # sorted list makes the min/max bounds check O(1), so skip the
+        # binary search entirely when the window misses the history
+        if not timestamps or timestamps[-1] < start or timestamps[0] >= end:
+            return []
+        lo = bisect_left(timestamps, start)
+        hi = bisect_left(timestamps, end)
+        return self.dose_history[lo:hi]
+
+    def doses_before(self, cutoff: datetime) -> list[DoseRecord]:
+        """Return all dose records older than cutoff without removing them."""
+        return self.dose_history[: bisect_left(self._dose_timestamps, cutoff)]
+
+    def drop_doses_before(self, cutoff: datetime) -> None:
+        """Remove all dose records older than cutoff."""
+        index = bisect_left(self._dose_timestamps, cutoff)
+        if index == 0:
+            return
+        self.dose_history = self.dose_history[index:]
+        self._dose_timestamps = self._dose_timestamps[index:]
+        self.invalidate_derived()
+
+    def record_dose_taken(self, timestamp: datetime, notes: str = "") -> DoseRecord:
         """Record that a dose was taken."""
         record = DoseRecord(timestamp=timestamp, taken=True, notes=notes)
-        self.dose_history.append(record)
+        self._append_dose(record)
         # Don't cache _last_taken - calculate it dynamically from dose_history
         self._update_next_due(timestamp)
         # Update status after recording dose
         self.update_status(timestamp)
+        return record
 
-    def record_dose_skipped(self, timestamp: datetime, notes: str = "") -> None:
+    def record_dose_skipped(self, timestamp: datetime, notes: str = "") -> DoseRecord:
         """Record that a dose was skipped."""
         record = DoseRecord(timestamp=timestamp, taken=False, notes=notes)
-        self.dose_history.append(record)
+        self._append_dose(record)
         # When skipping, use the current next_due time (scheduled time) to calculate next due
         scheduled_time = self.next_due if self.next_due else timestamp
         self._update_next_due(scheduled_time)
         # Update status after recording dose
         self.update_status(timestamp)
+        return record
 
     def reset_schedule(self) -> None:
         """Reset schedule calculations to force recalculation."""
@@ -717,6 +799,10 @@ class MedicationEntry:
     @property
     def doses_per_day(self) -> float:
         """Calculate average doses per day based on frequency."""
+        return self._compute_doses_per_day(dt_util.now())
+
+    def _compute_doses_per_day(self, now: datetime) -> float:
+        """Calculate average doses per day relative to the given time."""
         if self.data.frequency == FREQUENCY_DAILY:
             return len(self.data.times) if self.data.times else 1
         elif self.data.frequency == FREQUENCY_WEEKLY:
@@ -724,16 +810,15 @@ class MedicationEntry:
         elif self.data.frequency == FREQUENCY_MONTHLY:
             return 1 / 30
         elif self.data.frequency == FREQUENCY_AS_NEEDED:
-            return self._calculate_as_needed_average()
+            return self._calculate_as_needed_average(now)
         return 1
 
-    def _calculate_as_needed_average(self) -> float:
+    def _calculate_as_needed_average(self, now: datetime) -> float:
         """Calculate average daily doses for as-needed medications."""
         if not self.dose_history:
             return 0
 
         # Look at last 30 days of history
-        now = dt_util.now()
         cutoff = now - timedelta(days=30)
         recent_doses = [
             d for d in self.dose_history if d.taken and d.timestamp >= cutoff
@@ -747,31 +832,62 @@ class MedicationEntry:
         )
         return len(recent_doses) / max(days_span, 1)
 
-    @property
-    def daily_consumption(self) -> float:
-        """Calculate daily pill consumption rate."""
-        return self.doses_per_day * self.data.pills_per_dose
+    def invalidate_derived(self) -> None:
+        """Mark cached supply aggregates as stale."""
+        self._derived_fresh = False
+
+    def refresh_derived(self, now: datetime | None = None) -> None:
+        """Recompute the cached supply aggregates.
+
+        Called once per coordinator update cycle so calendar rendering,
+        sensors and event firing all share a single computation. The
+        coordinator passes its tick's ``now`` so one pass over all
+        medications costs a single clock/timezone lookup.
+        """
+        if now is None:
+            now = dt_util.now()
+        self._daily_consumption = (
+            self._compute_doses_per_day(now) * self.data.pills_per_dose
+        )
+        self._days_remaining = self._compute_days_remaining()
+        if self._days_remaining is None:
+            self._estimated_refill_date = None
+        else:
+            self._estimated_refill_date = now.date() + timedelta(
+                days=int(self._days_remaining)
+            )
+        self._derived_fresh = True
 
-    @property
-    def days_of_supply_remaining(self) -> float | None:
+    def _compute_days_remaining(self) -> float | None:
         """Calculate how many days of supply remain."""
         if not self.data.supply_tracking_enabled or self.data.current_supply is None:
             return None
 
-        daily_consumption = self.daily_consumption
-        if daily_consumption <= 0:
+        if self._daily_consumption <= 0:
             return None
 
-        return self.data.current_supply / daily_consumption
+        return self.data.current_supply / self._daily_consumption
 
     @property
-    def estimated_refill_date(self) -> date | None:
-        """Calculate estimated date when refill will be needed."""
-        days_remaining = self.days_of_supply_remaining
-        if days_remaining is None:
-            return None
+    def daily_consumption(self) -> float:
+        """Get the daily pill consumption rate."""
+        if not self._derived_fresh:
+            self.refresh_derived()
+        return self._daily_consumption
 
-        return dt_util.now().date() + timedelta(days=int(days_remaining))
+    @property
+    def days_of_supply_remaining(self) -> float | None:
+        """Get how many days of supply remain."""
+        if not self._derived_fresh:
+            self.refresh_derived()
+        return self._days_remaining
+
+    @property
+    def estimated_refill_date(self) -> date | None:
+        """Get the estimated date when a refill will be needed."""
+        if not self._derived_fresh:
+            self.refresh_derived()
+        return self._estimated_refill_date
 
     @property
     def is_low_supply(self) -> bool:
@@ -793,4 +909,5 @@ class MedicationEntry:
         self.data.current_supply = max(
             0, self.data.current_supply - self.data.pills_per_dose
         )
+        self.invalidate_derived()
         return True
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from functools import partial
 import logging
+from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util import dt as dt_util
 
@@ -46,6 +50,45 @@ from .models import MedicationData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared schema fragments, built once at import time
+_FREQUENCY_CHOICES = frozenset(
+    {
+        FREQUENCY_DAILY,
+        FREQUENCY_WEEKLY,
+        FREQUENCY_MONTHLY,
+        FREQUENCY_AS_NEEDED,
+    }
+)
+_STR_LIST_VALIDATOR = [cv.string]
+
+# Added to start-of-day to get the last representable instant of that day
+_END_OF_DAY_OFFSET = timedelta(days=1, microseconds=-1)
+
+# Service-call keys that map directly onto MedicationData fields; dates are
+# handled separately because they need timezone conversion
+_UPDATE_FIELD_MAP = {
+    CONF_MEDICATION_NAME: "name",
+    CONF_DOSAGE: "dosage",
+    CONF_FREQUENCY: "frequency",
+    CONF_TIMES: "times",
+    CONF_NOTES: "notes",
+    CONF_SUPPLY_TRACKING_ENABLED: "supply_tracking_enabled",
+    CONF_CURRENT_SUPPLY: "current_supply",
+    CONF_PILLS_PER_DOSE: "pills_per_dose",
+    CONF_REFILL_REMINDER_THRESHOLD: "refill_reminder_threshold",
+    CONF_SHOW_REFILL_ON_CALENDAR: "show_refill_on_calendar",
+}
+
+_SERVICE_NAMES = (
+    SERVICE_TAKE_MEDICATION,
+    SERVICE_SKIP_MEDICATION,
+    SERVICE_ADD_MEDICATION,
+    SERVICE_REMOVE_MEDICATION,
+    SERVICE_UPDATE_MEDICATION,
+    SERVICE_REFILL_MEDICATION,
+    SERVICE_UPDATE_SUPPLY,
+)
+
 TAKE_MEDICATION_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_MEDICATION_ID): cv.string,
@@ -64,15 +107,8 @@ ADD_MEDICATION_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_MEDICATION_NAME): cv.string,
         vol.Required(CONF_DOSAGE): cv.string,
-        vol.Required(CONF_FREQUENCY): vol.In(
-            [
-                FREQUENCY_DAILY,
-                FREQUENCY_WEEKLY,
-                FREQUENCY_MONTHLY,
-                FREQUENCY_AS_NEEDED,
-            ]
-        ),
-        vol.Optional(CONF_TIMES, default=[]): [cv.string],
+        vol.Required(CONF_FREQUENCY): vol.In(_FREQUENCY_CHOICES),
+        vol.Optional(CONF_TIMES, default=[]): _STR_LIST_VALIDATOR,
         vol.Optional(CONF_START_DATE): cv.date,
         vol.Optional(CONF_END_DATE): cv.date,
         vol.Optional(CONF_NOTES, default=""): cv.string,
@@ -96,15 +132,8 @@ UPDATE_MEDICATION_SCHEMA = vol.Schema(
         vol.Required(ATTR_MEDICATION_ID): cv.string,
         vol.Optional(CONF_MEDICATION_NAME): cv.string,
         vol.Optional(CONF_DOSAGE): cv.string,
-        vol.Optional(CONF_FREQUENCY): vol.In(
-            [
-                FREQUENCY_DAILY,
-                FREQUENCY_WEEKLY,
-                FREQUENCY_MONTHLY,
-                FREQUENCY_AS_NEEDED,
-            ]
-        ),
-        vol.Optional(CONF_TIMES): [cv.string],
+        vol.Optional(CONF_FREQUENCY): vol.In(_FREQUENCY_CHOICES),
+        vol.Optional(CONF_TIMES): _STR_LIST_VALIDATOR,
         vol.Optional(CONF_START_DATE): cv.date,
         vol.Optional(CONF_END_DATE): cv.date,
         vol.Optional(CONF_NOTES): cv.string,
@@ -133,294 +162,247 @@ UPDATE_SUPPLY_SCHEMA = vol.Schema(
 )
 
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for Medication Tracker."""
 
-    # Check if services are already registered to avoid duplicates
-    if hass.services.has_service(DOMAIN, SERVICE_TAKE_MEDICATION):
-        _LOGGER.debug("Services already registered, skipping setup")
+def _ensure_tz(hass: HomeAssistant, value: datetime | None) -> datetime | None:
+    """Attach the local timezone to a naive datetime.
+
+    The timezone is snapshotted into hass.data at service setup and
+    refreshed on core config updates, so a direct replace is equivalent
+    to dt_util.as_local for naive inputs without the per-call timezone
+    lookup and conversion dispatch.
+    """
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=hass.data[DOMAIN]["_tz"])
+
+
+def _to_start_end(
+    start: date | datetime | None, end: date | datetime | None
+) -> tuple[datetime | None, datetime | None]:
+    """Convert plain dates to local start-of-day / end-of-day datetimes.
+
+    Datetimes and None pass through untouched (a datetime IS-A date, so
+    the exclusion matters). The timezone helper is bound once per call
+    rather than per conversion.
+    """
+    sod = dt_util.start_of_local_day
+    if isinstance(start, date) and not isinstance(start, datetime):
+        start = sod(start)
+    if isinstance(end, date) and not isinstance(end, datetime):
+        end = sod(end) + _END_OF_DAY_OFFSET
+    return start, end
+
+
+async def handle_take_medication(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle take medication service call."""
+    medication_id = call.data[ATTR_MEDICATION_ID]
+    taken_at = _ensure_tz(hass, call.data.get(ATTR_DATETIME))
+
+    # Find the coordinator for this medication
+    coordinator = _get_coordinator_for_medication(hass, medication_id)
+    if coordinator:
+        await coordinator.async_take_medication(medication_id, taken_at)
+    else:
+        _LOGGER.error("Medication %s not found", medication_id)
+
+
+async def handle_skip_medication(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle skip medication service call."""
+    medication_id = call.data[ATTR_MEDICATION_ID]
+    skipped_at = _ensure_tz(hass, call.data.get(ATTR_DATETIME))
+
+    coordinator = _get_coordinator_for_medication(hass, medication_id)
+    if coordinator:
+        await coordinator.async_skip_medication(medication_id, skipped_at)
+    else:
+        _LOGGER.error("Medication %s not found", medication_id)
+
+
+async def handle_add_medication(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle add medication service call."""
+    # For simplicity, add to the first available coordinator
+    coordinators = _get_all_coordinators(hass)
+    if not coordinators:
+        _LOGGER.error("No medication tracker instances found")
         return
 
-    async def handle_take_medication(call: ServiceCall) -> None:
-        """Handle take medication service call."""
-        medication_id = call.data[ATTR_MEDICATION_ID]
-        taken_at = call.data.get(ATTR_DATETIME)
+    coordinator = coordinators[0]
 
-        # Convert naive datetime to timezone-aware datetime if needed
-        if taken_at is not None and taken_at.tzinfo is None:
-            taken_at = dt_util.as_local(taken_at)
+    # Convert date objects to local timezone datetime objects
+    start_date, end_date = _to_start_end(
+        call.data.get(CONF_START_DATE), call.data.get(CONF_END_DATE)
+    )
+    medication_data = MedicationData(
+        name=call.data[CONF_MEDICATION_NAME],
+        dosage=call.data[CONF_DOSAGE],
+        frequency=call.data[CONF_FREQUENCY],
+        times=call.data.get(CONF_TIMES, []),
+        start_date=start_date,
+        end_date=end_date,
+        notes=call.data.get(CONF_NOTES, ""),
+        # Supply tracking fields
+        supply_tracking_enabled=call.data.get(CONF_SUPPLY_TRACKING_ENABLED, False),
+        current_supply=call.data.get(CONF_CURRENT_SUPPLY),
+        pills_per_dose=call.data.get(CONF_PILLS_PER_DOSE, 1),
+        refill_reminder_threshold=call.data.get(CONF_REFILL_REMINDER_THRESHOLD, 7),
+        show_refill_on_calendar=call.data.get(CONF_SHOW_REFILL_ON_CALENDAR, False),
+    )
 
-        # Find the coordinator for this medication
-        coordinator = _get_coordinator_for_medication(hass, medication_id)
-        if coordinator:
-            await coordinator.async_take_medication(medication_id, taken_at)
-        else:
-            _LOGGER.error("Medication %s not found", medication_id)
+    medication_id = await coordinator.async_add_medication(medication_data)
+    _LOGGER.info(
+        "Added medication %s with ID %s", medication_data.name, medication_id
+    )
 
-    async def handle_skip_medication(call: ServiceCall) -> None:
-        """Handle skip medication service call."""
-        medication_id = call.data[ATTR_MEDICATION_ID]
-        skipped_at = call.data.get(ATTR_DATETIME)
 
-        # Convert naive datetime to timezone-aware datetime if needed
-        if skipped_at is not None and skipped_at.tzinfo is None:
-            skipped_at = dt_util.as_local(skipped_at)
+async def handle_remove_medication(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle remove medication service call."""
+    medication_id = call.data[ATTR_MEDICATION_ID]
 
-        coordinator = _get_coordinator_for_medication(hass, medication_id)
-        if coordinator:
-            await coordinator.async_skip_medication(medication_id, skipped_at)
+    coordinator = _get_coordinator_for_medication(hass, medication_id)
+    if coordinator:
+        success = await coordinator.async_remove_medication(medication_id)
+        if success:
+            _LOGGER.info("Removed medication %s", medication_id)
         else:
-            _LOGGER.error("Medication %s not found", medication_id)
-
-    async def handle_add_medication(call: ServiceCall) -> None:
-        """Handle add medication service call."""
-        # For simplicity, add to the first available coordinator
-        coordinators = _get_all_coordinators(hass)
-        if not coordinators:
-            _LOGGER.error("No medication tracker instances found")
-            return
-
-        coordinator = coordinators[0]
-
-        # Convert date objects to local timezone datetime objects
-        start_date = call.data.get(CONF_START_DATE)
-        if start_date is not None:
-            # Convert date to start of day in local timezone (00:00:00)
-            start_date = dt_util.start_of_local_day(start_date)
-
-        end_date = call.data.get(CONF_END_DATE)
-        if end_date is not None:
-            # Convert date to end of day in local timezone (23:59:59.999999)
-            end_date = (
-                dt_util.start_of_local_day(end_date)
-                + timedelta(days=1)
-                - timedelta(microseconds=1)
-            )
-        medication_data = MedicationData(
-            name=call.data[CONF_MEDICATION_NAME],
-            dosage=call.data[CONF_DOSAGE],
-            frequency=call.data[CONF_FREQUENCY],
-            times=call.data.get(CONF_TIMES, []),
-            start_date=start_date,
-            end_date=end_date,
-            notes=call.data.get(CONF_NOTES, ""),
-            # Supply tracking fields
-            supply_tracking_enabled=call.data.get(CONF_SUPPLY_TRACKING_ENABLED, False),
-            current_supply=call.data.get(CONF_CURRENT_SUPPLY),
-            pills_per_dose=call.data.get(CONF_PILLS_PER_DOSE, 1),
-            refill_reminder_threshold=call.data.get(CONF_REFILL_REMINDER_THRESHOLD, 7),
-            show_refill_on_calendar=call.data.get(CONF_SHOW_REFILL_ON_CALENDAR, False),
-        )
+            _LOGGER.error("Failed to remove medication %s", medication_id)
+    else:
+        _LOGGER.error("Medication %s not found", medication_id)
 
-        medication_id = await coordinator.async_add_medication(medication_data)
-        _LOGGER.info(
-            "Added medication %s with ID %s", medication_data.name, medication_id
-        )
 
-    async def handle_remove_medication(call: ServiceCall) -> None:
-        """Handle remove medication service call."""
-        medication_id = call.data[ATTR_MEDICATION_ID]
-
-        coordinator = _get_coordinator_for_medication(hass, medication_id)
-        if coordinator:
-            success = await coordinator.async_remove_medication(medication_id)
-            if success:
-                _LOGGER.info("Removed medication %s", medication_id)
-            else:
-                _LOGGER.error("Failed to remove medication %s", medication_id)
-        else:
-            _LOGGER.error("Medication %s not found", medication_id)
-
-    async def handle_update_medication(call: ServiceCall) -> None:
-        """Handle update medication service call."""
-        medication_id = call.data[ATTR_MEDICATION_ID]
-
-        coordinator = _get_coordinator_for_medication(hass, medication_id)
-        if not coordinator:
-            _LOGGER.error("Medication %s not found", medication_id)
-            return
-
-        # Get the current medication data
-        current_medication = coordinator.get_medication(medication_id)
-        if not current_medication:
-            _LOGGER.error("Medication %s not found", medication_id)
-            return
-
-        # Handle date conversions
-        start_date = call.data.get(CONF_START_DATE, current_medication.data.start_date)
-        if start_date is not None and not isinstance(start_date, (type(None), str)):
-            # If it's a date object (not None or string), convert to local timezone datetime
-            start_date = dt_util.start_of_local_day(start_date)
-
-        end_date = call.data.get(CONF_END_DATE, current_medication.data.end_date)
-        if end_date is not None and not isinstance(end_date, (type(None), str)):
-            # If it's a date object (not None or string), convert to end of day in local timezone
-            end_date = (
-                dt_util.start_of_local_day(end_date)
-                + timedelta(days=1)
-                - timedelta(microseconds=1)
-            )
+async def handle_update_medication(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle update medication service call."""
+    medication_id = call.data[ATTR_MEDICATION_ID]
 
-        # Create updated medication data, keeping existing values for fields not provided
-        updated_data = MedicationData(
-            name=call.data.get(CONF_MEDICATION_NAME, current_medication.data.name),
-            dosage=call.data.get(CONF_DOSAGE, current_medication.data.dosage),
-            frequency=call.data.get(CONF_FREQUENCY, current_medication.data.frequency),
-            times=call.data.get(CONF_TIMES, current_medication.data.times),
-            start_date=start_date,
-            end_date=end_date,
-            notes=call.data.get(CONF_NOTES, current_medication.data.notes),
-            # Supply tracking fields
-            supply_tracking_enabled=call.data.get(
-                CONF_SUPPLY_TRACKING_ENABLED,
-                current_medication.data.supply_tracking_enabled,
-            ),
-            current_supply=call.data.get(
-                CONF_CURRENT_SUPPLY, current_medication.data.current_supply
-            ),
-            pills_per_dose=call.data.get(
-                CONF_PILLS_PER_DOSE, current_medication.data.pills_per_dose
-            ),
-            refill_reminder_threshold=call.data.get(
-                CONF_REFILL_REMINDER_THRESHOLD,
-                current_medication.data.refill_reminder_threshold,
-            ),
-            last_refill_date=current_medication.data.last_refill_date,
-            show_refill_on_calendar=call.data.get(
-                CONF_SHOW_REFILL_ON_CALENDAR,
-                current_medication.data.show_refill_on_calendar,
-            ),
-        )
+    coordinator = _get_coordinator_for_medication(hass, medication_id)
+    if not coordinator:
+        _LOGGER.error("Medication %s not found", medication_id)
+        return
+
+    # Get the current medication data
+    current_medication = coordinator.get_medication(medication_id)
+    if not current_medication:
+        _LOGGER.error("Medication %s not found", medication_id)
+        return
 
-        success = await coordinator.async_update_medication(medication_id, updated_data)
+    # Handle date conversions
+    start_date, end_date = _to_start_end(
+        call.data.get(CONF_START_DATE, current_medication.data.start_date),
+        call.data.get(CONF_END_DATE, current_medication.data.end_date),
+    )
+
+    # Copy the current data, overriding only the fields that were provided;
+    # untouched fields (including last_refill_date) carry over automatically
+    changes: dict[str, Any] = {
+        field_name: call.data[conf_key]
+        for conf_key, field_name in _UPDATE_FIELD_MAP.items()
+        if conf_key in call.data
+    }
+    changes["start_date"] = start_date
+    changes["end_date"] = end_date
+    updated_data = replace(current_medication.data, **changes)
+
+    success = await coordinator.async_update_medication(medication_id, updated_data)
+    if success:
+        _LOGGER.info("Updated medication %s (%s)", medication_id, updated_data.name)
+    else:
+        _LOGGER.error("Failed to update medication %s", medication_id)
+
+
+async def handle_refill_medication(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle refill medication service call."""
+    medication_id = call.data[ATTR_MEDICATION_ID]
+    refill_amount = call.data[ATTR_REFILL_AMOUNT]
+    refill_date = _ensure_tz(hass, call.data.get(ATTR_DATETIME))
+
+    coordinator = _get_coordinator_for_medication(hass, medication_id)
+    if coordinator:
+        success = await coordinator.async_refill_medication(
+            medication_id, refill_amount, refill_date
+        )
         if success:
-            _LOGGER.info("Updated medication %s (%s)", medication_id, updated_data.name)
-        else:
-            _LOGGER.error("Failed to update medication %s", medication_id)
-
-    async def handle_refill_medication(call: ServiceCall) -> None:
-        """Handle refill medication service call."""
-        medication_id = call.data[ATTR_MEDICATION_ID]
-        refill_amount = call.data[ATTR_REFILL_AMOUNT]
-        refill_date = call.data.get(ATTR_DATETIME)
-
-        # Convert naive datetime to timezone-aware datetime if needed
-        if refill_date is not None and refill_date.tzinfo is None:
-            refill_date = dt_util.as_local(refill_date)
-
-        coordinator = _get_coordinator_for_medication(hass, medication_id)
-        if coordinator:
-            success = await coordinator.async_refill_medication(
-                medication_id, refill_amount, refill_date
+            _LOGGER.info(
+                "Refilled medication %s with %d units", medication_id, refill_amount
             )
-            if success:
-                _LOGGER.info(
-                    "Refilled medication %s with %d units", medication_id, refill_amount
-                )
-            else:
-                _LOGGER.error("Failed to refill medication %s", medication_id)
-        else:
-            _LOGGER.error("Medication %s not found", medication_id)
-
-    async def handle_update_supply(call: ServiceCall) -> None:
-        """Handle update supply service call."""
-        medication_id = call.data[ATTR_MEDICATION_ID]
-        new_supply = call.data[ATTR_CURRENT_SUPPLY]
-
-        coordinator = _get_coordinator_for_medication(hass, medication_id)
-        if coordinator:
-            success = await coordinator.async_update_supply(medication_id, new_supply)
-            if success:
-                _LOGGER.info(
-                    "Updated supply for medication %s to %d", medication_id, new_supply
-                )
-            else:
-                _LOGGER.error("Failed to update supply for medication %s", medication_id)
         else:
-            _LOGGER.error("Medication %s not found", medication_id)
+            _LOGGER.error("Failed to refill medication %s", medication_id)
+    else:
+        _LOGGER.error("Medication %s not found", medication_id)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TAKE_MEDICATION,
-        handle_take_medication,
-        schema=TAKE_MEDICATION_SCHEMA,
-    )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SKIP_MEDICATION,
-        handle_skip_medication,
-        schema=SKIP_MEDICATION_SCHEMA,
-    )
+async def handle_update_supply(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle update supply service call."""
+    medication_id = call.data[ATTR_MEDICATION_ID]
+    new_supply = call.data[ATTR_CURRENT_SUPPLY]
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ADD_MEDICATION,
-        handle_add_medication,
-        schema=ADD_MEDICATION_SCHEMA,
-    )
+    coordinator = _get_coordinator_for_medication(hass, medication_id)
+    if coordinator:
+        success = await coordinator.async_update_supply(medication_id, new_supply)
+        if success:
+            _LOGGER.info(
+                "Updated supply for medication %s to %d", medication_id, new_supply
+            )
+        else:
+            _LOGGER.error("Failed to update supply for medication %s", medication_id)
+    else:
+        _LOGGER.error("Medication %s not found", medication_id)
+
+
+# Registration table; handlers are module-level coroutine functions bound
+# to hass with functools.partial at setup time
+_SERVICES = (
+    (SERVICE_TAKE_MEDICATION, handle_take_medication, TAKE_MEDICATION_SCHEMA),
+    (SERVICE_SKIP_MEDICATION, handle_skip_medication, SKIP_MEDICATION_SCHEMA),
+    (SERVICE_ADD_MEDICATION, handle_add_medication, ADD_MEDICATION_SCHEMA),
+    (SERVICE_REMOVE_MEDICATION, handle_remove_medication, REMOVE_MEDICATION_SCHEMA),
+    (SERVICE_UPDATE_MEDICATION, handle_update_medication, UPDATE_MEDICATION_SCHEMA),
+    (SERVICE_REFILL_MEDICATION, handle_refill_medication, REFILL_MEDICATION_SCHEMA),
+    (SERVICE_UPDATE_SUPPLY, handle_update_supply, UPDATE_SUPPLY_SCHEMA),
+)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REMOVE_MEDICATION,
-        handle_remove_medication,
-        schema=REMOVE_MEDICATION_SCHEMA,
-    )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UPDATE_MEDICATION,
-        handle_update_medication,
-        schema=UPDATE_MEDICATION_SCHEMA,
-    )
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for Medication Tracker.
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REFILL_MEDICATION,
-        handle_refill_medication,
-        schema=REFILL_MEDICATION_SCHEMA,
-    )
+    Called exactly once from the integration's async_setup, so no
+    duplicate-registration guard is needed.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data["_tz"] = dt_util.DEFAULT_TIME_ZONE
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UPDATE_SUPPLY,
-        handle_update_supply,
-        schema=UPDATE_SUPPLY_SCHEMA,
-    )
+    @callback
+    def _refresh_tz(_event: Event) -> None:
+        """Re-snapshot the timezone after a core config change."""
+        domain_data["_tz"] = dt_util.DEFAULT_TIME_ZONE
+
+    hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, _refresh_tz)
+
+    for service_name, handler, schema in _SERVICES:
+        hass.services.async_register(
+            DOMAIN, service_name, partial(handler, hass), schema=schema
+        )
 
 
 def _get_coordinator_for_medication(
     hass: HomeAssistant, medication_id: str
 ) -> MedicationCoordinator | None:
-    """Find the coordinator that contains the specified medication."""
-    if DOMAIN not in hass.data:
-        return None
+    """Find the coordinator that contains the specified medication.
 
-    for coordinator in hass.data[DOMAIN].values():
-        if isinstance(coordinator, MedicationCoordinator):
-            if coordinator.get_medication(medication_id):
-                return coordinator
-    return None
+    Coordinators keep the medication index up to date as medications are
+    loaded, added and removed, so dispatch is a single dict lookup.
+    """
+    return hass.data.get(DOMAIN, {}).get("_med_index", {}).get(medication_id)
 
 
 def _get_all_coordinators(hass: HomeAssistant) -> list[MedicationCoordinator]:
-    """Get all medication coordinators."""
-    if DOMAIN not in hass.data:
-        return []
+    """Get all medication coordinators.
 
-    return [
-        coordinator
-        for coordinator in hass.data[DOMAIN].values()
-        if isinstance(coordinator, MedicationCoordinator)
-    ]
+    Entry setup/unload maintains the coordinator registry, so no
+    isinstance filtering over the domain data is needed here.
+    """
+    return list(hass.data.get(DOMAIN, {}).get("_coordinators", {}).values())
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload services."""
-    hass.services.async_remove(DOMAIN, SERVICE_TAKE_MEDICATION)
-    hass.services.async_remove(DOMAIN, SERVICE_SKIP_MEDICATION)
-    hass.services.async_remove(DOMAIN, SERVICE_ADD_MEDICATION)
-    hass.services.async_remove(DOMAIN, SERVICE_REMOVE_MEDICATION)
-    hass.services.async_remove(DOMAIN, SERVICE_UPDATE_MEDICATION)
-    hass.services.async_remove(DOMAIN, SERVICE_REFILL_MEDICATION)
-    hass.services.async_remove(DOMAIN, SERVICE_UPDATE_SUPPLY)
+    for service_name in _SERVICE_NAMES:
+        hass.services.async_remove(DOMAIN, service_name)